@@ -2,15 +2,55 @@
 
 import os
 import pathlib
-from typing import Any
 
 import aiosqlite
 
+from app.core import queries
 from app.core.logging import log
 
 # Database path, preferably mounted as a Docker volume
 DB_PATH = os.environ.get("DB_PATH", "/data/bridge.db")
 
+# Connection tuning applied to every connection: WAL lets readers run alongside
+# the CLI writer, and synchronous=NORMAL skips the fsync on every commit
+# (still durable across application crashes in WAL mode)
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA busy_timeout=3000",  # 3 seconds
+)
+
+# Shared connection, opened lazily and reused for the lifetime of the process
+_db: aiosqlite.Connection | None = None
+
+
+async def _get_db() -> aiosqlite.Connection:
+    """Return the shared database connection, opening it on first use.
+
+    Returns:
+        The configured database connection.
+
+    """
+    global _db  # noqa: PLW0603 # pylint: disable=global-statement
+    if _db is None:
+        db = await aiosqlite.connect(DB_PATH)
+        for pragma in PRAGMAS:
+            await db.execute(pragma)
+        db.row_factory = aiosqlite.Row
+        _db = db
+    return _db
+
+
+async def close_db() -> None:
+    """Close the shared database connection if it is open."""
+    global _db  # noqa: PLW0603 # pylint: disable=global-statement
+    if _db is not None:
+        await _db.close()
+        _db = None
+
 
 async def init_db() -> None:
     """Create the mappings table if it doesn't exist."""
@@ -19,18 +59,18 @@ async def init_db() -> None:
     if not db_parent.exists():
         db_parent.mkdir(exist_ok=True, parents=True)
 
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS mappings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                ntfy_server TEXT NOT NULL,
-                ntfy_topic TEXT NOT NULL,
-                discord_webhook TEXT NOT NULL,
-                ntfy_auth_header TEXT,
-                UNIQUE(ntfy_server, ntfy_topic, discord_webhook)
-            )
-        """)
-        await db.commit()
+    db = await _get_db()
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS mappings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ntfy_server TEXT NOT NULL,
+            ntfy_topic TEXT NOT NULL,
+            discord_webhook TEXT NOT NULL,
+            ntfy_auth_header TEXT,
+            UNIQUE(ntfy_server, ntfy_topic, discord_webhook)
+        )
+    """)
+    await db.commit()
     log.info("Database initialized at %s", DB_PATH)
 
 
@@ -52,25 +92,49 @@ async def add_mapping(
         True if the mapping was added successfully, False otherwise.
 
     """
+    db = await _get_db()
     try:
-        async with aiosqlite.connect(DB_PATH) as db:
-            await db.execute(
-                """
-                INSERT INTO mappings
-                (ntfy_server, ntfy_topic, discord_webhook, ntfy_auth_header)
-                VALUES (?, ?, ?, ?)
-                """,
-                (server, topic, webhook, auth_header),
-            )
-            await db.commit()
+        await db.execute(
+            queries.INSERT_MAPPING_SQL,
+            (server, topic, webhook, auth_header),
+        )
+        await db.commit()
         log.info("Mapping added: %s/%s -> Discord", server, topic)
     except aiosqlite.IntegrityError:
+        # Don't leave the failed transaction open on the shared connection
+        await db.rollback()
         log.warning("Mapping %s/%s -> %s already exists.", server, topic, webhook)
         return False
 
     return True
 
 
+async def add_mappings(rows: list[tuple[str, str, str, str | None]]) -> int:
+    """Add multiple mappings in a single transaction.
+
+    Mappings that already exist are skipped instead of aborting the batch.
+
+    Args:
+        rows: Tuples of (server, topic, webhook, auth_header).
+
+    Returns:
+        The number of mappings that were actually added.
+
+    Raises:
+        aiosqlite.Error: If the batch insert fails; the transaction is rolled back.
+
+    """
+    db = await _get_db()
+    try:
+        cursor = await db.executemany(queries.INSERT_OR_IGNORE_MAPPING_SQL, rows)
+        await db.commit()
+    except aiosqlite.Error:
+        await db.rollback()
+        raise
+    log.info("Mappings added: %s of %s", cursor.rowcount, len(rows))
+    return cursor.rowcount
+
+
 async def remove_mapping(mapping_id: int) -> bool:
     """Remove a mapping based on its ID.
 
@@ -81,27 +145,42 @@ async def remove_mapping(mapping_id: int) -> bool:
         True if the mapping was removed successfully, False otherwise.
 
     """
-    async with aiosqlite.connect(DB_PATH) as db:
-        cursor = await db.execute("DELETE FROM mappings WHERE id = ?", (mapping_id,))
-        await db.commit()
-        if cursor.rowcount == 0:
-            log.warning("Mapping not found with ID: %s", mapping_id)
-            return False
-        log.info("Mapping removed with ID: %s", mapping_id)
-        return True
+    db = await _get_db()
+    cursor = await db.execute(queries.DELETE_MAPPING_SQL, (mapping_id,))
+    await db.commit()
+    if cursor.rowcount == 0:
+        log.warning("Mapping not found with ID: %s", mapping_id)
+        return False
+    log.info("Mapping removed with ID: %s", mapping_id)
+    return True
 
 
-async def list_mappings() -> list[dict[str, Any]]:
+async def list_mappings() -> list[aiosqlite.Row]:
     """Return a list of all mappings.
 
+    Rows support access by column name (e.g. ``row["id"]``), so they are
+    returned as-is instead of being copied into dictionaries.
+
     Returns:
         A list of all mappings.
 
     """
-    async with aiosqlite.connect(DB_PATH) as db:
-        # Use Row factory to get results as dictionaries
-        db.row_factory = aiosqlite.Row
-        async with db.execute("SELECT * FROM mappings") as cursor:
-            rows = await cursor.fetchall()
-            # Convert Row objects to regular dictionaries
-            return [dict(row) for row in rows]
+    db = await _get_db()
+    async with db.execute(queries.LIST_MAPPINGS_SQL) as cursor:
+        return await cursor.fetchall()
+
+
+async def get_mappings_version() -> int:
+    """Return a counter that changes whenever another connection commits.
+
+    Mappings are only modified by the CLI, so comparing this value between
+    calls tells whether :func:`list_mappings` needs to be queried again.
+
+    Returns:
+        The current data version of the shared connection.
+
+    """
+    db = await _get_db()
+    async with db.execute(queries.DATA_VERSION_SQL) as cursor:
+        row = await cursor.fetchone()
+    return row[0]
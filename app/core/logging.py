@@ -4,13 +4,22 @@ import logging
 
 from rich.logging import RichHandler
 
-# Konfigurujemy logger, aby używał RichHandler dla ładnego formatowania
+# Service logs go through the plain stdlib formatter, which stays cheap on the
+# per-message path (Rich rendering costs far more per record)
 logging.basicConfig(
     level="INFO",
-    format="%(message)s",
+    format="%(asctime)s %(levelname)-8s %(message)s",
     datefmt="[%X]",
-    handlers=[RichHandler(rich_tracebacks=True, tracebacks_suppress=[])],
 )
 
-# Pobieramy główny logger
-log = logging.getLogger("rich")
+# httpx logs every request at INFO, i.e. one record per forwarded message;
+# keep only its warnings
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# Main service logger
+log = logging.getLogger("bridge")
+
+# CLI logger uses RichHandler for nice interactive formatting
+cli_log = logging.getLogger("bridge.cli")
+cli_log.addHandler(RichHandler(rich_tracebacks=True, tracebacks_suppress=[]))
+cli_log.propagate = False
@@ -0,0 +1,24 @@
+"""Cached view of the mappings table, refreshed only when it changes."""
+
+import aiosqlite
+
+from app.core import database
+
+# Mappings from the last database query and the data version they were read at
+_mappings: list[aiosqlite.Row] = []
+_mappings_version: int | None = None
+
+
+async def load_mappings() -> list[aiosqlite.Row]:
+    """Return all mappings, querying the table only when it has changed.
+
+    Returns:
+        The current list of mappings.
+
+    """
+    global _mappings, _mappings_version  # noqa: PLW0603 # pylint: disable=global-statement
+    version = await database.get_mappings_version()
+    if version != _mappings_version:
+        _mappings = await database.list_mappings()
+        _mappings_version = version
+    return _mappings
@@ -0,0 +1,21 @@
+"""SQL statements used by the database module."""
+
+# Statement text is kept identical between calls so the sqlite3 module's
+# per-connection prepared-statement cache is hit instead of re-parsing
+INSERT_MAPPING_SQL = """
+    INSERT INTO mappings
+    (ntfy_server, ntfy_topic, discord_webhook, ntfy_auth_header)
+    VALUES (?, ?, ?, ?)
+"""
+INSERT_OR_IGNORE_MAPPING_SQL = """
+    INSERT OR IGNORE INTO mappings
+    (ntfy_server, ntfy_topic, discord_webhook, ntfy_auth_header)
+    VALUES (?, ?, ?, ?)
+"""
+DELETE_MAPPING_SQL = "DELETE FROM mappings WHERE id = ?"
+LIST_MAPPINGS_SQL = """
+    SELECT id, ntfy_server, ntfy_topic, discord_webhook, ntfy_auth_header
+    FROM mappings
+"""
+# Bumped by SQLite whenever another connection (e.g. the CLI) commits a change
+DATA_VERSION_SQL = "PRAGMA data_version"
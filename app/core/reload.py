@@ -0,0 +1,139 @@
+"""Reload signalling between the CLI and the running bridge service."""
+
+import asyncio
+import fcntl
+import os
+import pathlib
+import signal
+import socket
+from typing import TextIO
+
+from app.core.database import DB_PATH
+from app.core.logging import log
+
+# PID file of the running service, kept next to the database by default
+PID_PATH = os.environ.get("PID_PATH", str(pathlib.Path(DB_PATH).with_suffix(".pid")))
+
+# Signal the service traps to reload mappings immediately
+RELOAD_SIGNAL = signal.SIGUSR1
+
+# Set when mappings change so the management loop reloads immediately
+_reload_event = asyncio.Event()
+
+# Fallback interval (seconds) for re-checking the database without a signal
+RELOAD_INTERVAL = 300
+
+# PID file of this process, kept open (and locked) while the service runs
+_pid_file: TextIO | None = None
+
+
+def _pid_namespace() -> str:
+    """Identify the PID namespace of this process.
+
+    A PID is only meaningful inside its namespace, e.g. the service is PID 1
+    in its container while the CLI may run on the host.
+
+    Returns:
+        The PID namespace link (e.g. "pid:[4026531836]"), or the host name
+        where procfs is unavailable.
+
+    """
+    try:
+        return str(pathlib.Path("/proc/self/ns/pid").readlink())
+    except OSError:
+        return socket.gethostname()
+
+
+def write_pid_file() -> None:
+    """Record the PID of the running service so the CLI can signal it.
+
+    The file stays exclusively locked for the lifetime of the service. The
+    lock is released by the OS however the process ends, so a PID file left
+    behind by a killed service is recognised as stale.
+
+    Raises:
+        BlockingIOError: If another bridge service already holds the PID file.
+
+    """
+    global _pid_file  # noqa: PLW0603 # pylint: disable=global-statement
+    # Opened without truncating so a running service's PID isn't wiped
+    pid_file = pathlib.Path(PID_PATH).open("a+", encoding="utf-8")  # noqa: SIM115
+    try:
+        fcntl.flock(pid_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        pid_file.close()
+        raise
+    pid_file.truncate(0)
+    pid_file.write(f"{os.getpid()}\n{_pid_namespace()}")
+    pid_file.flush()
+    _pid_file = pid_file
+
+
+def remove_pid_file() -> None:
+    """Remove the PID file on service shutdown."""
+    global _pid_file  # noqa: PLW0603 # pylint: disable=global-statement
+    pathlib.Path(PID_PATH).unlink(missing_ok=True)
+    if _pid_file is not None:
+        _pid_file.close()
+        _pid_file = None
+
+
+def _read_service_pid() -> int | None:
+    """Read the PID of the running service from the PID file.
+
+    Only a process that still holds the PID file lock counts as running, and
+    its PID is only used from the same PID namespace, so the CLI never
+    signals an unrelated process that happens to have that PID.
+
+    Returns:
+        The service PID, or None if the service can't be signalled from here.
+
+    """
+    with pathlib.Path(PID_PATH).open(encoding="utf-8") as pid_file:
+        try:
+            fcntl.flock(pid_file, fcntl.LOCK_SH | fcntl.LOCK_NB)
+        except BlockingIOError:
+            # Locked, so the service that wrote the PID is still running
+            pid, _, namespace = pid_file.read().partition("\n")
+            if namespace == _pid_namespace():
+                return int(pid)
+            log.debug("The bridge service runs in another PID namespace")
+            return None
+    log.debug("Stale PID file, the bridge service is not running")
+    return None
+
+
+def notify_service() -> bool:
+    """Ask the running service to reload mappings.
+
+    Returns:
+        True if the service was signalled, False if it could not be reached
+        (it will still pick up the change on its next periodic check).
+
+    """
+    try:
+        pid = _read_service_pid()
+        if pid is None:
+            return False
+        os.kill(pid, RELOAD_SIGNAL)
+    except (OSError, ValueError) as e:
+        log.debug(
+            "Could not signal the bridge service: %(error)s",
+            {"error": e},
+        )
+        return False
+    return True
+
+
+def request_reload() -> None:
+    """Wake the management loop to reload mappings from the database."""
+    _reload_event.set()
+
+
+async def wait_for_reload() -> None:
+    """Wait until a reload is requested or the fallback interval elapses."""
+    try:
+        await asyncio.wait_for(_reload_event.wait(), timeout=RELOAD_INTERVAL)
+    except TimeoutError:
+        return
+    _reload_event.clear()
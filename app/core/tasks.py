@@ -0,0 +1,61 @@
+"""Helpers for stopping listener tasks."""
+
+import asyncio
+import functools
+
+from app.core.logging import log
+
+# Maximum time (seconds) to wait for cancelled listeners to stop
+CANCEL_TIMEOUT = 5
+
+# Cancelled tasks that didn't stop within CANCEL_TIMEOUT; asyncio only keeps
+# weak references to tasks, so they are held here until they finish
+_stopping_tasks: set[asyncio.Task] = set()
+
+
+def _on_stopped_task_done(mapping_id: int, task: asyncio.Task) -> None:
+    """Release a task that outlived CANCEL_TIMEOUT and log how it ended.
+
+    Args:
+        mapping_id: The mapping ID.
+        task: The finished task.
+
+    """
+    _stopping_tasks.discard(task)
+    if not task.cancelled() and (exception := task.exception()) is not None:
+        log.warning(
+            "Stopped task [ID: %(mapping_id)s] ended with an error: %(error)r",
+            {"mapping_id": mapping_id, "error": exception},
+            exc_info=exception,
+        )
+
+
+async def cancel_tasks(tasks: dict[int, asyncio.Task]) -> None:
+    """Cancel tasks and wait for all of them to finish concurrently.
+
+    Waiting is bounded by CANCEL_TIMEOUT so a listener that doesn't react to
+    cancellation can't block the management loop.
+
+    Args:
+        tasks: Dictionary of mapping ID -> task to cancel.
+
+    """
+    if not tasks:
+        return
+    for task in tasks.values():
+        task.cancel()
+    _, pending = await asyncio.wait(tasks.values(), timeout=CANCEL_TIMEOUT)
+    for mapping_id, task in tasks.items():
+        if task in pending:
+            log.warning(
+                "Task [ID: %(mapping_id)s] did not stop within %(timeout)ss.",
+                {"mapping_id": mapping_id, "timeout": CANCEL_TIMEOUT},
+            )
+            # Keep a strong reference until it finally stops
+            _stopping_tasks.add(task)
+            task.add_done_callback(functools.partial(_on_stopped_task_done, mapping_id))
+        elif task.cancelled():
+            log.debug(
+                "Task [ID: %(mapping_id)s] successfully cancelled.",
+                {"mapping_id": mapping_id},
+            )
@@ -4,8 +4,9 @@ from datetime import UTC, datetime
 from typing import Any
 
 import httpx
+import orjson
 
-from app.core.logging import log
+from app.discord_http import send_webhook
 
 # Discord embed colors (decimal RGB values)
 COLOR_INFO = 3447003  # Blue
@@ -23,6 +24,14 @@ EMOJI_SUCCESS = "✅"
 EMOJI_WARNING = "⚠️"
 EMOJI_ERROR = "❌"
 
+# String priorities accepted by Ntfy, mapped to (color, emoji)
+PRIORITY_STR_MAP: dict[str, tuple[int, str]] = {
+    "urgent": (COLOR_ERROR, EMOJI_ERROR),
+    "5": (COLOR_ERROR, EMOJI_ERROR),
+    "high": (COLOR_WARNING, EMOJI_WARNING),
+    "4": (COLOR_WARNING, EMOJI_WARNING),
+}
+
 # Tag sets for notification type detection
 ERROR_TAGS = {"error", "skull", "rotating_light", "fire", "boom"}
 WARNING_TAGS = {"warning", "exclamation", "construction"}
@@ -35,21 +44,21 @@ SUCCESS_TAGS = {
 }
 
 
-def _check_tags_for_type(tags_lower: list[str]) -> tuple[int, str] | None:
+def _check_tags_for_type(tags_set: frozenset[str]) -> tuple[int, str] | None:
     """Check if tags indicate a specific notification type.
 
     Args:
-        tags_lower: Lowercase list of tags.
+        tags_set: Lowercase set of tags.
 
     Returns:
         Tuple of (color, emoji) if tags match a type, None otherwise.
 
     """
-    if any(tag in tags_lower for tag in ERROR_TAGS):
+    if ERROR_TAGS & tags_set:
         return (COLOR_ERROR, EMOJI_ERROR)
-    if any(tag in tags_lower for tag in WARNING_TAGS):
+    if WARNING_TAGS & tags_set:
         return (COLOR_WARNING, EMOJI_WARNING)
-    if any(tag in tags_lower for tag in SUCCESS_TAGS):
+    if SUCCESS_TAGS & tags_set:
         return (COLOR_SUCCESS, EMOJI_SUCCESS)
     return None
 
@@ -66,14 +75,7 @@ def _priority_to_type(priority: int | str) -> tuple[int, str]:
     """
     # Handle string priorities
     if isinstance(priority, str):
-        priority_lower = priority.lower()
-        priority_map: dict[str, tuple[int, str]] = {
-            "urgent": (COLOR_ERROR, EMOJI_ERROR),
-            "5": (COLOR_ERROR, EMOJI_ERROR),
-            "high": (COLOR_WARNING, EMOJI_WARNING),
-            "4": (COLOR_WARNING, EMOJI_WARNING),
-        }
-        return priority_map.get(priority_lower, (COLOR_INFO, EMOJI_INFO))
+        return PRIORITY_STR_MAP.get(priority.lower(), (COLOR_INFO, EMOJI_INFO))
 
     # Handle numeric priorities
     if isinstance(priority, int):
@@ -102,11 +104,10 @@ def _determine_notification_type(
         - emoji: Emoji string for the notification type
 
     """
-    tags = tags or []
-    tags_lower = [tag.lower() for tag in tags]
+    tags_set = frozenset(tag.lower() for tag in tags) if tags else frozenset()
 
     # Check tags first (they can override priority)
-    tag_result = _check_tags_for_type(tags_lower)
+    tag_result = _check_tags_for_type(tags_set)
     if tag_result is not None:
         return tag_result
 
@@ -117,20 +118,31 @@ def _determine_notification_type(
     return _priority_to_type(priority)
 
 
-async def post_to_discord(
-    session: httpx.AsyncClient,
-    webhook_url: str,
+def build_footer(topic: str | None) -> dict[str, str]:
+    """Build the embed footer for messages from a topic.
+
+    Args:
+        topic: The Ntfy topic.
+
+    Returns:
+        The Discord embed footer.
+
+    """
+    return {"text": f"Ntfy topic: {topic}"}
+
+
+def _build_payload(
     ntfy_message: dict[str, Any],
-) -> None:
-    """Send a formatted Ntfy message to a Discord webhook.
+    footer: dict[str, str],
+) -> dict[str, Any]:
+    """Build the Discord webhook payload for an Ntfy message.
 
     Args:
-        session: The HTTP client session.
-        webhook_url: The Discord webhook URL.
         ntfy_message: The Ntfy message dictionary.
+        footer: The embed footer, shared by every message of a topic.
 
-    Raises:
-        httpx.RequestError: If the request error occurs.
+    Returns:
+        The webhook payload, ready for orjson.
 
     """
     title = ntfy_message.get("title", "New Ntfy message")
@@ -146,43 +158,39 @@ async def post_to_discord(
         title = f"{emoji} {title}"
 
     # Get timestamp from ntfy message or use current time
-    # Ntfy provides 'time' as Unix timestamp in seconds
+    # Ntfy provides 'time' as Unix timestamp in seconds; orjson serializes
+    # the datetime to ISO 8601 itself
     timestamp = ntfy_message.get("time")
-    if timestamp:
-        # Convert Unix timestamp to ISO 8601 format
-        dt = datetime.fromtimestamp(timestamp, tz=UTC)
-        timestamp_iso = dt.isoformat()
-    else:
-        # Use current time if not provided
-        timestamp_iso = datetime.now(UTC).isoformat()
+    dt = datetime.fromtimestamp(timestamp, tz=UTC) if timestamp else datetime.now(UTC)
 
     # Create a nice payload for Discord
-    payload = {
+    return {
         "embeds": [
             {
                 "title": title,
                 "description": message,
                 "color": color,
-                "timestamp": timestamp_iso,
-                "footer": {
-                    "text": f"Ntfy topic: {ntfy_message.get('topic')}",
-                },
+                "timestamp": dt,
+                "footer": footer,
             },
         ],
     }
 
-    try:
-        response = await session.post(webhook_url, json=payload)
-        response.raise_for_status()
-        log.info(
-            "Successfully sent message to Discord (topic: %(topic)s)",
-            {"topic": ntfy_message.get("topic")},
-        )
-    except httpx.HTTPStatusError as e:
-        log.error(
-            "Error sending to Discord (%(status_code)s): %(text)s",
-            {"status_code": e.response.status_code, "text": e.response.text},
-        )
-    except httpx.RequestError as e:
-        log.error("Connection error sending to Discord: %(error)r", {"error": e})
-        raise
+
+async def post_to_discord(
+    session: httpx.AsyncClient,
+    webhook_url: str,
+    ntfy_message: dict[str, Any],
+    footer: dict[str, str],
+) -> None:
+    """Send a formatted Ntfy message to a Discord webhook.
+
+    Args:
+        session: The HTTP client session.
+        webhook_url: The Discord webhook URL.
+        ntfy_message: The Ntfy message dictionary.
+        footer: The embed footer, built once per topic (see build_footer).
+
+    """
+    body = orjson.dumps(_build_payload(ntfy_message, footer))
+    await send_webhook(session, webhook_url, body, ntfy_message.get("topic"))
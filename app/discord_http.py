@@ -0,0 +1,125 @@
+"""HTTP transport for Discord webhooks."""
+
+import asyncio
+import logging
+
+import httpx
+
+from app.core.logging import log
+
+# Timeout (seconds) for Discord webhook requests
+DISCORD_TIMEOUT = 10.0
+
+# Maximum number of Discord webhook requests in flight across all listeners;
+# when Discord is slow, listeners wait here instead of piling up requests
+MAX_CONCURRENT_POSTS = 32
+_discord_sem = asyncio.Semaphore(MAX_CONCURRENT_POSTS)
+
+# Discord rate limiting: retry 429 responses after the delay Discord asks for
+HTTP_TOO_MANY_REQUESTS = 429
+MAX_SEND_ATTEMPTS = 3
+DEFAULT_RETRY_AFTER = 1.0  # seconds, when Discord sends no usable header
+MAX_RETRY_AFTER = 60.0  # seconds
+
+# Headers for the pre-serialized JSON payload
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def create_discord_client() -> httpx.AsyncClient:
+    """Create the HTTP client shared by all listeners for Discord webhooks.
+
+    Every webhook lives on discord.com, so one pooled HTTP/2 client lets all
+    mappings reuse the same keep-alive connection and TLS session.
+
+    Returns:
+        The configured HTTP client.
+
+    """
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=0,
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=32,
+            keepalive_expiry=30.0,
+        ),
+    )
+    return httpx.AsyncClient(transport=transport, timeout=DISCORD_TIMEOUT)
+
+
+async def send_webhook(
+    session: httpx.AsyncClient,
+    webhook_url: str,
+    body: bytes,
+    topic: str | None,
+) -> None:
+    """Post a serialized payload to a Discord webhook.
+
+    Rate-limited (429) requests are retried up to MAX_SEND_ATTEMPTS times.
+
+    Args:
+        session: The HTTP client session.
+        webhook_url: The Discord webhook URL.
+        body: The JSON-encoded webhook payload.
+        topic: The Ntfy topic of the message, for logging.
+
+    Raises:
+        httpx.RequestError: If the request error occurs.
+
+    """
+    for attempt in range(1, MAX_SEND_ATTEMPTS + 1):
+        try:
+            async with _discord_sem:
+                response = await session.post(
+                    webhook_url,
+                    content=body,
+                    headers=JSON_HEADERS,
+                )
+            # Only build the status error for the rare failed request
+            if not response.is_success:
+                response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            if (
+                e.response.status_code == HTTP_TOO_MANY_REQUESTS
+                and attempt < MAX_SEND_ATTEMPTS
+            ):
+                # Wait outside the semaphore so other webhooks keep flowing
+                await _wait_for_rate_limit(e.response)
+                continue
+            log.error(
+                "Error sending to Discord (%(status_code)s): %(text)s",
+                {"status_code": e.response.status_code, "text": e.response.text},
+            )
+        except httpx.RequestError as e:
+            log.error("Connection error sending to Discord: %(error)r", {"error": e})
+            raise
+        else:
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(
+                    "Successfully sent message to Discord (topic: %(topic)s)",
+                    {"topic": topic},
+                )
+        return
+
+
+async def _wait_for_rate_limit(response: httpx.Response) -> None:
+    """Sleep for as long as Discord asks after a 429 response.
+
+    Args:
+        response: The rate-limited response.
+
+    """
+    reset_after = response.headers.get(
+        "X-RateLimit-Reset-After",
+        response.headers.get("Retry-After"),
+    )
+    try:
+        delay = float(reset_after) if reset_after else DEFAULT_RETRY_AFTER
+    except ValueError:
+        delay = DEFAULT_RETRY_AFTER
+    delay = min(delay, MAX_RETRY_AFTER)
+    log.warning(
+        "Rate limited by Discord, retrying in %(delay).2fs",
+        {"delay": delay},
+    )
+    await asyncio.sleep(delay)
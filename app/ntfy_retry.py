@@ -0,0 +1,76 @@
+"""Reconnect loop for Ntfy listeners."""
+
+import asyncio
+import random
+from collections.abc import Awaitable, Callable
+
+import httpx
+
+from app.core.logging import log
+
+# Give up reconnecting after this many seconds of consecutive failures
+RETRY_MAX_TIME = 300
+
+# Cap on the exponential reconnect backoff, i.e. at most 2**8 = 256 seconds
+RETRY_MAX_EXPONENT = 8
+
+# A stream that stayed up this long (seconds) before failing counts as healthy,
+# so its failure starts a fresh retry window instead of continuing the backoff
+HEALTHY_STREAM_TIME = 60
+
+
+async def retry_connection(
+    listen_once: Callable[[Callable[[], None]], Awaitable[None]],
+    mapping_id: int,
+) -> None:
+    """Run a listener, reconnecting on connection errors.
+
+    Retries use fully jittered exponential backoff for up to RETRY_MAX_TIME
+    seconds. The window and the backoff only start over after a stream that
+    stayed up for at least HEALTHY_STREAM_TIME seconds, so a server that
+    accepts and immediately drops the stream still escalates and gives up.
+
+    Args:
+        listen_once: Connects once and listens until the stream ends; it is
+            passed a callback to call once the connection is established.
+        mapping_id: The mapping ID, for logging.
+
+    Raises:
+        httpx.RequestError: If the connection keeps failing past RETRY_MAX_TIME.
+
+    """
+    loop = asyncio.get_running_loop()
+    deadline: float | None = None
+    connected_at: float | None = None
+    attempt = 0
+
+    def on_connected() -> None:
+        nonlocal connected_at
+        connected_at = loop.time()
+
+    while True:
+        try:
+            await listen_once(on_connected)
+        except httpx.RequestError:
+            now = loop.time()
+            if connected_at is not None and now - connected_at >= HEALTHY_STREAM_TIME:
+                # A healthy stream ends the run of consecutive failures
+                deadline = None
+                attempt = 0
+            connected_at = None
+            if deadline is None:
+                deadline = now + RETRY_MAX_TIME
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise
+            # Full jitter spreads out reconnects of listeners dropped together
+            backoff = 2 ** min(attempt, RETRY_MAX_EXPONENT)
+            delay = min(random.uniform(0, backoff), remaining)  # noqa: S311
+            log.info(
+                "[ID: %(mapping_id)s] Reconnecting in %(delay).1fs",
+                {"mapping_id": mapping_id, "delay": delay},
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+        else:
+            return
@@ -0,0 +1,101 @@
+"""Ntfy stream framing and message forwarding."""
+
+import logging
+from collections.abc import AsyncGenerator
+
+import httpx
+import orjson
+
+from app.core.logging import log
+from app.discord import build_footer, post_to_discord
+
+# Markers of message events in the raw stream (Ntfy emits compact JSON)
+MESSAGE_EVENT = b'"event":"message"'
+MESSAGE_EVENT_SPACED = b'"event": "message"'
+
+
+async def _iter_ndjson_lines(
+    response: httpx.Response,
+) -> AsyncGenerator[bytes, None]:
+    """Split the raw Ntfy stream into newline-delimited lines.
+
+    Works on bytes so lines can go straight to orjson without a str decode.
+    Only each new chunk is scanned for newlines; partial lines are collected
+    in a list and joined once when their newline arrives. The chunk size is
+    left unset, as httpx would otherwise hold data back until a full chunk
+    has been buffered.
+
+    Args:
+        response: The HTTP response stream.
+
+    Yields:
+        Single lines without the trailing newline.
+
+    """
+    pending: list[bytes] = []
+    async for chunk in response.aiter_bytes():
+        start = 0
+        while (newline := chunk.find(b"\n", start)) != -1:
+            pending.append(chunk[start:newline])
+            yield b"".join(pending)
+            pending.clear()
+            start = newline + 1
+        if start < len(chunk):
+            pending.append(chunk[start:])
+    if pending:
+        yield b"".join(pending)
+
+
+async def process_ntfy_stream(
+    response: httpx.Response,
+    mapping_id: int,
+    discord_client: httpx.AsyncClient,
+    webhook_url: str,
+) -> None:
+    """Process lines from Ntfy stream and forward messages to Discord.
+
+    Args:
+        response: The HTTP response stream.
+        mapping_id: The mapping ID.
+        discord_client: The Discord HTTP client.
+        webhook_url: The Discord webhook URL.
+
+    """
+    # Embed footers by message topic; a multi-topic subscription ("a,b")
+    # delivers messages from several topics over one stream
+    footers: dict[str, dict[str, str]] = {}
+    async for line in _iter_ndjson_lines(response):
+        if not line:
+            continue
+        # Skip open/keepalive/poll_request events without parsing them
+        if MESSAGE_EVENT not in line and MESSAGE_EVENT_SPACED not in line:
+            continue
+
+        try:
+            data = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            log.warning(
+                (
+                    "[ID: %(mapping_id)s] Received invalid JSON "
+                    "from Ntfy stream: %(line)s"
+                ),
+                {"mapping_id": mapping_id, "line": line.decode(errors="replace")},
+            )
+            continue
+        if data.get("event") != "message":
+            continue
+
+        # Skip building the log args when INFO is disabled
+        if log.isEnabledFor(logging.INFO):
+            log.info(
+                ("[ID: %(mapping_id)s] Received message: %(title)s"),
+                {
+                    "mapping_id": mapping_id,
+                    "title": data.get("title"),
+                },
+            )
+        topic = data.get("topic")
+        footer = footers.get(topic)
+        if footer is None:
+            footer = footers[topic] = build_footer(topic)
+        await post_to_discord(discord_client, webhook_url, data, footer)
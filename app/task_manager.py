@@ -1,31 +1,43 @@
 """Task management module for handling listener tasks."""
 
 import asyncio
-from typing import Any
+import functools
 
-from app.core import database
+import aiosqlite
+import httpx
+
+from app.core import mappings_cache, reload
 from app.core.logging import log
+from app.core.tasks import cancel_tasks
 from app.ntfy import listen_to_ntfy
 
 # Dictionary storing active listening tasks (mapping ID -> asyncio task)
 running_tasks: dict[int, asyncio.Task] = {}
 
+# Mapping IDs whose listener ended on its own and is due for a restart
+_failed_task_ids: set[int] = set()
+
+# Delay (seconds) before restarting a listener that ended on its own
+RESTART_DELAY = 30
+
+
+def _on_listener_done(mapping_id: int, task: asyncio.Task) -> None:
+    """Drop a finished listener task and schedule its restart.
 
-def _cleanup_failed_tasks() -> list[int]:
-    """Check for failed/completed tasks and clean them up.
+    Cancelled tasks were stopped on purpose and are ignored.
 
-    Returns:
-        List of mapping IDs that failed and should be restarted.
+    Args:
+        mapping_id: The mapping ID.
+        task: The finished task.
 
     """
-    failed_task_ids = []
-    for mapping_id, task in list(running_tasks.items()):
-        if task.done():
-            failed_task_ids.append(mapping_id)
-            _log_task_failure(mapping_id, task)
-            # Remove the failed task
-            running_tasks.pop(mapping_id, None)
-    return failed_task_ids
+    if task.cancelled() or running_tasks.get(mapping_id) is not task:
+        return
+    del running_tasks[mapping_id]
+    _failed_task_ids.add(mapping_id)
+    _log_task_failure(mapping_id, task)
+    # Restart after a pause so a listener that ends immediately can't spin
+    asyncio.get_running_loop().call_later(RESTART_DELAY, reload.request_reload)
 
 
 def _log_task_failure(mapping_id: int, task: asyncio.Task) -> None:
@@ -46,6 +58,7 @@ def _log_task_failure(mapping_id: int, task: asyncio.Task) -> None:
                     "Will restart if mapping still exists."
                 ),
                 {"mapping_id": mapping_id, "error": exception},
+                exc_info=exception,
             )
         else:
             log.warning(
@@ -60,31 +73,40 @@ def _log_task_failure(mapping_id: int, task: asyncio.Task) -> None:
 
 
 def _start_new_listeners(
-    mappings: list[dict[str, Any]],
-    failed_task_ids: list[int],
+    mappings: list[aiosqlite.Row],
+    discord_client: httpx.AsyncClient,
 ) -> None:
     """Start new listeners for mappings that don't have active tasks.
 
     Args:
         mappings: List of mappings from database.
-        failed_task_ids: List of mapping IDs that failed and should be restarted.
+        discord_client: The shared Discord HTTP client.
 
     """
-    for mapping in mappings:
+    new_mappings = [m for m in mappings if m["id"] not in running_tasks]
+    new_ids = [m["id"] for m in new_mappings]
+    restarted_ids = [i for i in new_ids if i in _failed_task_ids]
+    if restarted_ids:
+        log.info(
+            "Restarting %(count)s failed listener(s): %(ids)s",
+            {"count": len(restarted_ids), "ids": restarted_ids},
+        )
+    if len(restarted_ids) < len(new_ids):
+        found_ids = [i for i in new_ids if i not in _failed_task_ids]
+        log.info(
+            "Found %(count)s new mapping(s), starting listeners: %(ids)s",
+            {"count": len(found_ids), "ids": found_ids},
+        )
+    for mapping in new_mappings:
         mapping_id = mapping["id"]
-        if mapping_id not in running_tasks:
-            if mapping_id in failed_task_ids:
-                log.info(
-                    ("Restarting failed listener for mapping [ID: %(mapping_id)s]..."),
-                    {"mapping_id": mapping_id},
-                )
-            else:
-                log.info(
-                    ("Found new mapping [ID: %(mapping_id)s], starting listener..."),
-                    {"mapping_id": mapping_id},
-                )
-            task = asyncio.create_task(listen_to_ntfy(mapping))
-            running_tasks[mapping_id] = task
+        task = asyncio.create_task(
+            listen_to_ntfy(mapping, discord_client),
+            name=f"ntfy-{mapping_id}",
+        )
+        task.add_done_callback(functools.partial(_on_listener_done, mapping_id))
+        running_tasks[mapping_id] = task
+    # Every failed listener whose mapping still exists has been restarted
+    _failed_task_ids.clear()
 
 
 async def _stop_deleted_listeners(stale_task_ids: set[int]) -> None:
@@ -99,36 +121,38 @@ async def _stop_deleted_listeners(stale_task_ids: set[int]) -> None:
             ("Mapping [ID: %(mapping_id)s] has been deleted, stopping listener..."),
             {"mapping_id": mapping_id},
         )
-        if mapping_id in running_tasks:
-            task = running_tasks.pop(mapping_id)
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                log.debug(
-                    "Task [ID: %(mapping_id)s] successfully cancelled.",
-                    {"mapping_id": mapping_id},
-                )
-
-
-async def manage_listeners() -> None:
-    """Main management loop.
+    stale_tasks = {
+        mapping_id: running_tasks.pop(mapping_id)
+        for mapping_id in stale_task_ids
+        if mapping_id in running_tasks
+    }
+    await cancel_tasks(stale_tasks)
+
+
+async def _stop_all_listeners() -> None:
+    """Cancel every running listener, e.g. on shutdown."""
+    tasks = running_tasks.copy()
+    running_tasks.clear()
+    await cancel_tasks(tasks)
+
+
+async def _run_management_loop(discord_client: httpx.AsyncClient) -> None:
+    """Check the database and dynamically start/stop listening tasks.
+
+    Args:
+        discord_client: The shared Discord HTTP client passed to every listener.
 
-    Checks the database and dynamically starts/stops listening tasks.
     """
     while True:
         try:
             log.info("🔄 Checking for database updates...")
-            mappings = await database.list_mappings()
+            mappings = await mappings_cache.load_mappings()
 
             current_mapping_ids = {m["id"] for m in mappings}
             active_task_ids = set(running_tasks.keys())
 
-            # Check for failed/completed tasks and clean them up
-            failed_task_ids = _cleanup_failed_tasks()
-
             # Start new listeners (including restarts for failed tasks)
-            _start_new_listeners(mappings, failed_task_ids)
+            _start_new_listeners(mappings, discord_client)
 
             # Stop deleted listeners
             stale_task_ids = active_task_ids - current_mapping_ids
@@ -141,5 +165,22 @@ async def manage_listeners() -> None:
                 exc_info=True,
             )
 
-        # Check database every 30 seconds
-        await asyncio.sleep(30)
+        # Wait for a reload signal, re-checking the database periodically
+        await reload.wait_for_reload()
+
+
+async def manage_listeners(discord_client: httpx.AsyncClient) -> None:
+    """Main management loop.
+
+    Checks the database and dynamically starts/stops listening tasks.
+    All listeners are cancelled when the loop stops.
+
+    Args:
+        discord_client: The shared Discord HTTP client passed to every listener.
+
+    """
+    try:
+        await _run_management_loop(discord_client)
+    finally:
+        # Don't leave listeners running once the management loop stops
+        await _stop_all_listeners()
@@ -9,8 +9,8 @@ import sys
 from rich.console import Console
 from rich.table import Table
 
-from app.core import database
-from app.core.logging import log
+from app.core import database, reload
+from app.core.logging import cli_log
 
 console = Console()
 
@@ -31,9 +31,8 @@ def build_auth_header(
     """
     if basic_creds:
         user, password = basic_creds
-        creds_str = f"{user}:{password}"
-        encoded_creds = base64.b64encode(creds_str.encode()).decode()
-        return f"Basic {encoded_creds}"
+        creds = user.encode() + b":" + password.encode()
+        return "Basic " + base64.b64encode(creds).decode("ascii")
     if token:
         return f"Bearer {token}"
     return None
@@ -55,6 +54,7 @@ async def cli_add(args: argparse.Namespace) -> None:
     )
     if not success:
         sys.exit(1)  # Exit with error code if mapping already exists
+    reload.notify_service()
 
 
 async def cli_remove(args: argparse.Namespace) -> None:
@@ -67,6 +67,7 @@ async def cli_remove(args: argparse.Namespace) -> None:
     success = await database.remove_mapping(args.id)
     if not success:
         sys.exit(1)
+    reload.notify_service()
 
 
 async def cli_list(args: argparse.Namespace) -> None:
@@ -109,6 +110,19 @@ async def cli_list(args: argparse.Namespace) -> None:
     console.print(table)
 
 
+async def run_command(args: argparse.Namespace) -> None:
+    """Run the selected CLI command and close the database afterwards.
+
+    Args:
+        args: The arguments.
+
+    """
+    try:
+        await args.func(args)
+    finally:
+        await database.close_db()
+
+
 def main() -> None:
     """Main function."""
     parser = argparse.ArgumentParser(
@@ -169,9 +183,9 @@ def main() -> None:
 
     # Use asyncio.run() to call the asynchronous CLI function
     try:
-        asyncio.run(args.func(args))
+        asyncio.run(run_command(args))
     except Exception as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
-        log.error(f"CLI error: {e}", exc_info=True)
+        cli_log.error(f"CLI error: {e}", exc_info=True)
         sys.exit(1)
 
 
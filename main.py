@@ -1,11 +1,14 @@
 """Main module for the ntfy-discord-bridge service."""
 
 import asyncio
+import signal
+import sys
 
 import uvloop
 
-from app.core import database
+from app.core import database, reload
 from app.core.logging import log
+from app.discord_http import create_discord_client
 from app.task_manager import manage_listeners
 
 
@@ -13,10 +16,32 @@ async def main() -> None:
     """Main function."""
     log.info("🚀 Starting Ntfy-Discord Bridge...")
     await database.init_db()
-    await manage_listeners()
+    try:
+        reload.write_pid_file()
+    except BlockingIOError:
+        log.error(
+            "Another bridge service is already running (PID file: %s)",
+            reload.PID_PATH,
+        )
+        await database.close_db()
+        sys.exit(1)
+
+    loop = asyncio.get_running_loop()
+    # Let the CLI trigger an immediate reload after adding/removing mappings
+    loop.add_signal_handler(reload.RELOAD_SIGNAL, reload.request_reload)
+    # docker stop / systemd send SIGTERM; cancel so the cleanup below runs
+    main_task = asyncio.current_task()
+    loop.add_signal_handler(signal.SIGTERM, main_task.cancel)
+    try:
+        async with create_discord_client() as discord_client:
+            await manage_listeners(discord_client)
+    except asyncio.CancelledError:
+        log.info("🛑 Stopping Ntfy-Discord Bridge...")
+    finally:
+        reload.remove_pid_file()
+        await database.close_db()
 
 
 if __name__ == "__main__":
     # Use uvloop for higher performance
-    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
-    asyncio.run(main())
+    uvloop.run(main())